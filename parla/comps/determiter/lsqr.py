@@ -407,7 +407,7 @@ def lsqr(A, b, damp=0.0, atol=1e-8, btol=1e-8, conlim=1e8,
         str3 = '  %8.1e %8.1e' % (test1, test2)
         print(str1, str2, str3)
 
-    arnorms = -np.ones(iter_lim)
+    arnorms = np.empty(iter_lim)
     # Main iteration loop.
     while itn < iter_lim:
         arnorms[itn] = arnorm
@@ -569,6 +569,7 @@ def lsqr(A, b, damp=0.0, atol=1e-8, btol=1e-8, conlim=1e8,
         print(str3 + '   ' + str4)
         print(' ')
 
-    arnorms = arnorms[arnorms > -1]
+    # arnorms[:itn] were written; copy to release the rest of the buffer.
+    arnorms = arnorms[:itn].copy()
 
     return x, istop, itn, r1norm, r2norm, anorm, acond, arnorms, xnorm, var
@@ -12,14 +12,18 @@ def pcg(mv_mat, rhs, mv_pre, iter_lim, tol, x0):
     # where M.T @ mat @ M is a better-conditioned positive definite matrix than mat.
     #
     # residuals[i] is the error ||mat x - rhs||_2^2 at iteration i.
+    #
+    # The vectors x, r, and d are owned by this function and are updated
+    # in-place, so mv_mat and mv_pre are free to return internal workspace.
     x = x0.copy()
-    residuals = -np.ones(iter_lim)
+    nrm2, axpy = la.get_blas_funcs(('nrm2', 'axpy'), (rhs,))
+    residuals = np.empty(iter_lim)
     r = rhs - mv_mat(x)
 
-    d = mv_pre(r)
+    d = mv_pre(r).copy()
     delta1_old = np.dot(r, d)
     delta1_new = delta1_old
-    cur_err = la.norm(r)
+    cur_err = nrm2(r)
     rel_tol = tol * cur_err
 
     i = 0
@@ -30,18 +34,19 @@ def pcg(mv_mat, rhs, mv_pre, iter_lim, tol, x0):
         q = mv_mat(d)
         den = np.dot(d, q)  # equal to d'*mat*d
         alpha = delta1_new / den
-        x += alpha * d
+        x = axpy(d, x, a=alpha)
         if i % 10 == 0:
-            r = rhs - mv_mat(x)
+            np.subtract(rhs, mv_mat(x), out=r)
         else:
-            r -= alpha * q
-        cur_err = la.norm(r)
+            r = axpy(q, r, a=-alpha)
+        cur_err = nrm2(r)
         s = mv_pre(r)
         delta1_old = delta1_new
         delta1_new = np.dot(r, s)  # equal to ||M'r||_2^2.
         beta = delta1_new / delta1_old
-        d = s + beta * d
+        d *= beta
+        d += s
         i += 1
-    residuals = residuals[:i]
+    residuals = residuals[:i].copy()
 
     return x, residuals
@@ -3,6 +3,8 @@ import scipy.linalg as la
 from parla.comps.determiter.pcg import pcg
 from parla.comps.determiter.lsqr import lsqr
 from parla.comps.preconditioning import a_lift_precond
+from parla.utils.linalg_wrappers import gemv
+from parla.utils.misc import get_workspace
 
 
 def pcss1(A, b, c, delta, tol, iter_lim, R, upper_tri, z0):
@@ -19,6 +21,20 @@ def pcss2(A, b, c, delta, tol, iter_lim, R, upper_tri, z0):
 
 class PrecondSaddleSolver:
 
+    def __init__(self):
+        self._buffers = dict()
+
+    def _buf(self, name, shape):
+        """
+        Return a workspace array that is kept between calls and reallocated
+        only when its shape changes. Its contents are undefined (they may be
+        left over from a previous call), so callers must write every entry they
+        later read. Callers must not return these arrays to users. Because of
+        this workspace, an instance must not be used by two solves at the same
+        time (e.g., from multiple threads).
+        """
+        return get_workspace(self._buffers, name, shape)
+
     def __call__(self, A, b, c, delta, tol, iter_lim, R, upper_tri, z0):
         """
         The problem data (A, b, c, delta) define a block linear system
@@ -91,6 +107,15 @@ class PcSS1(PrecondSaddleSolver):
         2-norm of the residual from the normal equations
     """
 
+    # The Gram matvec A'(A v) streams A through cache in row blocks of about
+    # this many bytes, so each block is reused for both A- and A'-products.
+    GRAM_BLOCK_BYTES = 2**19
+
+    # If delta > 0, n <= DIRECT_MAX_N, and m > DIRECT_MIN_ASPECT * n, then
+    # try to solve the normal equations by Cholesky before falling back on PCG.
+    DIRECT_MAX_N = 2000
+    DIRECT_MIN_ASPECT = 10
+
     def __call__(self, A, b, c, delta, tol, iter_lim, R, upper_tri, z0):
         """
         Let
@@ -114,6 +139,17 @@ class PcSS1(PrecondSaddleSolver):
 
             This defines a preconditioner M = RR' + (I - VV'), for which
             (A'A + delta*I)M should be well-conditioned.
+
+        If delta > 0 and A is very tall with few columns (see DIRECT_MAX_N
+        and DIRECT_MIN_ASPECT), then we solve the normal equations by Cholesky
+        on G = A'A + delta*I (ignoring R, z0, tol, and iter_lim), provided the
+        bound trace(G)/delta on cond(G) is below 1/sqrt(eps). Forming G costs
+        about m*n^2 flops, as many as roughly n/4 PCG iterations (up to 500
+        when n = DIRECT_MAX_N). But G is formed by a BLAS-3 call, while each
+        PCG iteration is limited by memory bandwidth, so for these shapes the
+        direct solve is usually faster. The returned error history then has a
+        single entry. Callers that build R themselves can check for this case
+        first with direct_solve.
         """
         m, n = A.shape
         if b is None:
@@ -124,50 +160,85 @@ class PcSS1(PrecondSaddleSolver):
 
         if upper_tri:
             raise NotImplementedError()
+        A = self._contiguous(A)
+
+        rhs = self._buf('rhs', (n,))
+        if c is None:
+            rhs = gemv(1.0, A, b, y=rhs, trans=True)
+        else:
+            np.copyto(rhs, c)
+            rhs = gemv(1.0, A, b, beta=-1.0, y=rhs, trans=True)
+
+        result = self.direct_solve(A, b, delta, rhs)
+        if result is None:
+            result = self._pcg_solve(A, b, rhs, delta, tol, iter_lim, R, z0)
+        return result
+
+    @staticmethod
+    def _contiguous(A):
+        if not (A.flags['C_CONTIGUOUS'] or A.flags['F_CONTIGUOUS']):
+            # BLAS needs unit stride along one axis; without this, every
+            # matvec would copy A. One O(mn) copy here pays for itself
+            # after a single PCG iteration.
+            A = np.asfortranarray(A)
+        return A
+
+    def _pcg_solve(self, A, b, rhs, delta, tol, iter_lim, R, z0):
+        """
+        Run the PCG branch of __call__, where rhs = A'b - c. This skips
+        direct_solve, so callers that have already tried it (and got None)
+        don't pay for it twice.
+        """
+        m, n = A.shape
+        A = self._contiguous(A)
         # inefficiently recover the orthogonal columns of M
-        work2 = np.zeros(m)
+        work2 = self._buf('work2', (m,))
         pc_dim = R.shape[1]
-        work1 = np.zeros(pc_dim)
+        work1 = self._buf('work1', (pc_dim,))
+        res_gram = self._buf('res_gram', (n,))
+        res_pre = self._buf('res_pre', (n,))
         fullrank_precond = pc_dim == n
         if not fullrank_precond:
             sing_vals = 1 / la.norm(R, axis=0)
             V = R * sing_vals
-            # Update sing_vals = sqrt(sing_vals**2 + delta).
-            #   (The method below isn't a stable way of doing that.)
-            sing_vals **= 2
-            sing_vals += delta
-            sing_vals **= 0.5
-            R[:] = V[:]
-            R /= (sing_vals/sing_vals[-1])
-            work3 = np.zeros(n)
+            # Rescale R in one pass, so that R = V / (new_vals/new_vals[-1])
+            # where new_vals = sqrt(sing_vals**2 + delta).
+            new_vals = np.hypot(sing_vals, np.sqrt(delta))
+            sing_vals *= new_vals[-1] / new_vals
+            R *= sing_vals
 
         def mv_pre(vec):
             # The preconditioner is RR' + (I - VV')
-            np.dot(R.T, vec, out=work1)
-            res = np.dot(R, work1)
-            if not fullrank_precond:
-                res += vec
-                np.dot(V.T, vec, out=work1)
-                np.dot(V, work1, out=work3)
-                res -= work3
-            return res
+            w1 = gemv(1.0, R, vec, y=work1, trans=True)
+            if fullrank_precond:
+                return gemv(1.0, R, w1, y=res_pre)
+            np.copyto(res_pre, vec)
+            res = gemv(1.0, R, w1, beta=1.0, y=res_pre)
+            w1 = gemv(1.0, V, vec, y=work1, trans=True)
+            return gemv(-1.0, V, w1, beta=1.0, y=res)
+
+        block = max(1, self.GRAM_BLOCK_BYTES // (A.itemsize * n))
+        if A.flags['C_CONTIGUOUS'] and m > block:
+            # Row blocks of a row-major A are contiguous.
+            A_blocks = [(A[i:i + block], work2[i:i + block])
+                        for i in range(0, m, block)]
+        else:
+            A_blocks = [(A, work2)]
 
         def mv_gram(vec):
-            np.dot(A, vec, out=work2)
-            res = A.T @ work2
-            res += delta * vec
-            return res
-
-        rhs = A.T @ b
-        if c is not None:
-            rhs -= c
+            np.copyto(res_gram, vec)
+            beta = delta
+            for A_blk, w_blk in A_blocks:
+                w_blk = gemv(1.0, A_blk, vec, y=w_blk)
+                gemv(1.0, A_blk, w_blk, beta=beta, y=res_gram, trans=True)
+                beta = 1.0
+            return res_gram
 
         if z0 is None or (not fullrank_precond):
             # TODO: proper initialization with low-rank preconditioners
             x = np.zeros(n)
         else:
             x = R @ z0
-
         x, residuals = pcg(mv_gram, rhs, mv_pre, iter_lim, tol, x)
 
         y = b - A @ x
@@ -175,6 +246,52 @@ class PcSS1(PrecondSaddleSolver):
 
         return result
 
+    def direct_solve(self, A, b, delta, rhs):
+        """
+        Return the result of __call__ when it would solve the normal equations
+        (A'A + delta*I) x = rhs by Cholesky, or None when it would run PCG.
+        Here rhs = A'b - c. The answer doesn't depend on a preconditioner, so
+        this can be checked before computing one. Once m and n pass the size
+        checks, a None return costs one pass over A (to bound cond(G)), plus
+        the m*n^2 flops of forming G and a failed Cholesky if the bound holds
+        but the factorization breaks down.
+        """
+        m, n = A.shape
+        if not (delta > 0 and n <= self.DIRECT_MAX_N
+                and m > self.DIRECT_MIN_ASPECT * n):
+            return None
+        x = self._gram_cholesky_solve(A, delta, rhs)
+        if x is None:
+            return None
+        gap = gemv(1.0, A, gemv(1.0, A, x), beta=delta, y=x.copy(), trans=True)
+        gap -= rhs
+        residuals = np.array([la.norm(gap)])
+        y = b - A @ x
+        return x, y, residuals
+
+    @staticmethod
+    def _gram_cholesky_solve(A, delta, rhs):
+        """
+        Return the solution to (A'A + delta*I) x = rhs, computed by Cholesky,
+        or None if that system may be too ill-conditioned to solve this way.
+        """
+        n = A.shape[1]
+        cond_bound = (np.linalg.norm(A)**2 + n * delta) / delta
+        if cond_bound > np.finfo(float).eps ** -0.5:
+            return None
+        syrk = la.get_blas_funcs('syrk', (A,))
+        if A.flags['C_CONTIGUOUS']:
+            G = syrk(1.0, A.T, trans=0)  # A.T is column-major; no copy.
+        else:
+            G = syrk(1.0, A, trans=1)
+        G.flat[::n + 1] += delta
+        try:
+            cho = la.cho_factor(G, lower=False, overwrite_a=True,
+                                check_finite=False)
+        except la.LinAlgError:
+            return None
+        return la.cho_solve(cho, rhs)
+
 
 # TODO: update so the error
 class PcSS2(PrecondSaddleSolver):
@@ -184,16 +301,28 @@ class PcSS2(PrecondSaddleSolver):
         (preconditioning on the left and right).
     """
 
+    def _lift_rhs(self, b, n):
+        """
+        Return [b; zeros(n)], reusing a buffer from previous calls.
+        """
+        b_lift = self._buf('b_lift', (b.size + n,))
+        b_lift[:b.size] = b
+        b_lift[b.size:] = 0.0
+        return b_lift
+
     def __call__(self, A, b, c, delta, tol, iter_lim, R, upper_tri, z0):
         m, n = A.shape
         k = 1 if (b is None or b.ndim == 1) else b.shape[1]
+        if not (A.flags['C_CONTIGUOUS'] or A.flags['F_CONTIGUOUS']):
+            # Same reasoning as in PcSS1: copy once rather than per matvec.
+            A = np.asfortranarray(A)
 
         A_pc, M_fwd, M_adj = a_lift_precond(A, delta, R, upper_tri, k)
 
         if c is None or la.norm(c) == 0:
             # Overdetermined least squares
             if delta > 0:
-                b = np.concatenate((b, np.zeros(n)))
+                b = self._lift_rhs(b, n)
             result = lsqr(A_pc, b, atol=tol, btol=tol, iter_lim=iter_lim, x0=z0)
             x = M_fwd(result[0])
             y = b[:m] - A @ x
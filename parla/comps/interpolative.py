@@ -8,7 +8,7 @@ import parla.utils.linalg_wrappers as ulaw
 import parla.utils.misc as misc
 
 
-def qrcp_osid(Y, k, axis):
+def qrcp_osid(Y, k, axis, overwrite_y=False):
     """
     Use QRCP to deterministically compute a rank-k one-sided ID of Y;
     return the skeleton indices and interpolative coefficient matrix.
@@ -24,6 +24,10 @@ def qrcp_osid(Y, k, axis):
     axis : int
         0 for a row ID, 1 for a column ID.
 
+    overwrite_y : bool
+        If True, Y may be overwritten by the QRCP. Set this when Y is a
+        temporary (such as a freshly computed sketch) to avoid copying it.
+
     Returns
     -------
 
@@ -47,24 +51,74 @@ def qrcp_osid(Y, k, axis):
 
         Y[:, Js] = (Y[:,Js] @ X)[:, Js].
     """
-    if axis == 1:
-        # Column ID
-        Q, S, J = la.qr(Y, mode='economic', pivoting=True)
-        S_trailing = la.solve_triangular(S[:k, :k], S[:k, k:],
-                                         overwrite_b=True,
-                                         lower=False)
-        X = np.zeros((k, Y.shape[1]))
-        X[:, J] = np.hstack((np.eye(k), S_trailing))
-        Js = J[:k]
-        # Y \approx C @ X; C = Y[:, Js]
-        return X, Js
-    elif axis == 0:
-        # Row ID
-        X, Is = qrcp_osid(Y.T, k, axis=1)
-        Z = X.T
-        return Z, Is
-    else:
+    return batched_qrcp_osid([Y], k, axis, overwrite_y)[0]
+
+
+def batched_qrcp_osid(Ys, k, axis, overwrite_y=False):
+    """
+    Return [qrcp_osid(Y, k, axis, overwrite_y) for Y in Ys].
+
+    This calls LAPACK's geqp3 directly, in the same way as batched_qrcp_pivots,
+    and qrcp_osid is implemented as a one-element batch.
+    """
+    if axis == 0:
+        res = batched_qrcp_osid([Y.T for Y in Ys], k, 1, overwrite_y)
+        return [(X.T, Is) for X, Is in res]
+    elif axis != 1:
         raise ValueError()
+    res = []
+    for Y, (qr, J) in zip(Ys, _batched_geqp3(Ys, overwrite_y)):
+        # The upper triangle of qr[:k, :] is the leading block of rows of R.
+        S_trailing = la.solve_triangular(qr[:k, :k], qr[:k, k:],
+                                         overwrite_b=True, lower=False,
+                                         check_finite=False)
+        X = np.empty((k, Y.shape[1]))
+        X[:, J[:k]] = np.eye(k)
+        X[:, J[k:]] = S_trailing
+        # Y \approx C @ X; C = Y[:, J[:k]]
+        res.append((X, J[:k]))
+    return res
+
+
+def qrcp_pivots(Y, k, overwrite_y=False):
+    """
+    Return the indices of the first k pivot columns chosen by QRCP of Y.
+
+    This calls LAPACK's geqp3 directly, which avoids the input checks and
+    the extraction of R done by scipy.linalg.qr. If overwrite_y is True
+    then Y may be overwritten.
+    """
+    return batched_qrcp_pivots([Y], k, overwrite_y)[0]
+
+
+def batched_qrcp_pivots(Ys, k, overwrite_y=False):
+    """
+    Return [qrcp_pivots(Y, k, overwrite_y) for Y in Ys].
+
+    The LAPACK routine is looked up once (so every Y should have the same
+    dtype), and the workspace size is queried once per distinct shape.
+    """
+    idxs = [J[:k] for _, J in _batched_geqp3(Ys, overwrite_y)]
+    return idxs
+
+
+def _batched_geqp3(Ys, overwrite_y):
+    """
+    Yield (QR, J) from LAPACK's geqp3 for each Y in Ys, where R is the upper
+    triangle of QR and J holds zero-based pivots, so Y[:, J] = Q @ R.
+    """
+    if len(Ys) == 0:
+        return
+    geqp3, = la.get_lapack_funcs(('geqp3',), (Ys[0],))
+    lworks = dict()
+    for Y in Ys:
+        if Y.shape not in lworks:
+            lworks[Y.shape] = int(geqp3(Y, lwork=-1)[3][0])
+        qr, jpvt, _, _, info = geqp3(Y, lwork=lworks[Y.shape],
+                                     overwrite_a=overwrite_y)
+        if info < 0:
+            raise ValueError(f'Illegal value in argument {-info} of geqp3.')
+        yield qr, jpvt - 1
 
 
 class RowOrColSelection:
@@ -120,7 +174,6 @@ class RowOrColSelection:
         power iteration method to help find a more accurate solution. 
     """))
 def rocs1(A, k, over, p, axis, rng):
-    rng = np.random.default_rng(rng)
     skop = osk.SkOpGA()
     rs = ask.RS1(skop, p - 1, ulaw.orth, passes_per_stab=1)
     alg = ROCS1(rs)
@@ -143,15 +196,13 @@ class ROCS1(RowOrColSelection):
             # Row ID
             Sk = self.sk_op(A, k + over, rng)
             Y = A @ Sk
-            _, _, I = la.qr(Y.T, mode='economic', pivoting=True)
-            Is = I[:k]
+            Is = qrcp_pivots(Y.T, k, overwrite_y=True)
             return Is
         elif axis == 1:
             # Column ID
             Sk = self.sk_op(A.T, k + over, rng).T
             Y = Sk @ A
-            _, _, J = la.qr(Y, mode='economic', pivoting=True)
-            Js = J[:k]
+            Js = qrcp_pivots(Y, k, overwrite_y=True)
             return Js
         else:
             raise ValueError()
@@ -13,6 +13,21 @@ def a_lift(A, scale):
         return A
 
 
+def sketch_and_lift(S, A, scale):
+    # Equivalent to a_lift(S @ A, scale). When S and A are ndarrays, S @ A is
+    # written directly into the top block of the lifted matrix.
+    if scale == 0:
+        return S @ A
+    if not (isinstance(S, np.ndarray) and isinstance(A, np.ndarray)):
+        return a_lift(S @ A, scale)
+    d, n = S.shape[0], A.shape[1]
+    A_ske = np.empty((d + n, n), dtype=np.result_type(S, A))
+    np.matmul(S, A, out=A_ske[:d])
+    A_ske[d:] = 0.0
+    np.fill_diagonal(A_ske[d:], scale)
+    return A_ske
+
+
 def a_lift_precond(A, delta, R, upper_tri=False, k=1):
     if k != 1:
         raise NotImplementedError()
@@ -67,13 +82,45 @@ def a_lift_precond(A, delta, R, upper_tri=False, k=1):
     return A_precond, M_fwd, M_adj
 
 
-def svd_right_precond(A_ske):
+def svd_right_precond(A_ske, dtype=None):
+    # If dtype is given (e.g., np.float32), then run the SVD in that precision
+    # and cast the returned factors back to the dtype of A_ske. Numerical rank
+    # is judged relative to the precision the SVD ran in, since smaller singular
+    # values are just rounding noise.
+    out_dtype = A_ske.dtype
+    if dtype is not None:
+        A_ske = A_ske.astype(dtype, copy=False)
     U, sigma, Vh = la.svd(A_ske, overwrite_a=True, check_finite=False,
                           full_matrices=False)
-    eps = np.finfo(float).eps
+    eps = np.finfo(sigma.dtype).eps
     rank = np.count_nonzero(sigma > sigma[0] * A_ske.shape[1] * eps)
     Vh = Vh[:rank, :]
     U = U[:, :rank]
     sigma = sigma[:rank]
     M = Vh.T / sigma
+    if M.dtype != out_dtype:
+        M, U, sigma, Vh = [arr.astype(out_dtype) for arr in (M, U, sigma, Vh)]
     return M, U, sigma, Vh
+
+
+def chol_right_precond(A_ske):
+    # Return M = R^{-1}, where R is the upper Cholesky factor of A_ske' A_ske,
+    # or None if A_ske may be too ill-conditioned for that to be accurate.
+    # This is cheaper than svd_right_precond but squares the condition number.
+    n = A_ske.shape[1]
+    syrk = la.get_blas_funcs('syrk', (A_ske,))
+    if A_ske.flags['C_CONTIGUOUS']:
+        G = syrk(1.0, A_ske.T, trans=0)  # A_ske.T is column-major; no copy.
+    else:
+        G = syrk(1.0, A_ske, trans=1)
+    try:
+        R = la.cholesky(G, lower=False, overwrite_a=True, check_finite=False)
+    except la.LinAlgError:
+        return None
+    diag = np.abs(np.diag(R))
+    # (max(diag) / min(diag))**2 is a lower bound on the condition number of G.
+    if diag.min() == 0 or (diag.max() / diag.min())**2 > np.finfo(float).eps ** -0.5:
+        return None
+    M = la.solve_triangular(R, np.eye(n), lower=False, overwrite_b=True,
+                            check_finite=False)
+    return M
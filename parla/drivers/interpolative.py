@@ -1,5 +1,4 @@
 import numpy as np
-import scipy.linalg as la
 from parla.comps.sketchers.aware import RowSketcher, RS1
 import parla.comps.sketchers.oblivious as osk
 import parla.comps.interpolative as id_comps
@@ -86,7 +85,6 @@ class OneSidedID:
         power iteration method to help find a more accurate solution. 
     """) + OneSidedID.BACKGROUND)
 def osid1(A, k, over, p, axis, rng):
-    rng = np.random.default_rng(rng)
     skop = osk.SkOpGA()
     rs = RS1(skop, p - 1, ulaw.orth, passes_per_stab=1)
     alg = OSID1(rs)
@@ -94,6 +92,18 @@ def osid1(A, k, over, p, axis, rng):
     return res
 
 
+def batched_osid1(As, k, over, p, axis, rng):
+    """
+    Return [osid1(A, k, over, p, axis, rng) for A in As], where all calls
+    share one Generator. See OSID1.batch.
+    """
+    skop = osk.SkOpGA()
+    rs = RS1(skop, p - 1, ulaw.orth, passes_per_stab=1)
+    alg = OSID1(rs)
+    res = alg.batch(As, k, over, axis, rng)
+    return res
+
+
 class OSID1(OneSidedID):
     """
     Sketch + QRCP approach to ID
@@ -111,17 +121,34 @@ class OSID1(OneSidedID):
             # Row ID
             Sk = self.sk_op(A, k + over, rng)
             Y = A @ Sk
-            X, Is = id_comps.qrcp_osid(Y, k, axis=0)
+            X, Is = id_comps.qrcp_osid(Y, k, axis=0, overwrite_y=True)
             return X, Is
         elif axis == 1:
             # Column ID
             Sk = self.sk_op(A.T, k + over, rng).T
             Y = Sk @ A
-            Z, Js = id_comps.qrcp_osid(Y, k, axis=1)
+            Z, Js = id_comps.qrcp_osid(Y, k, axis=1, overwrite_y=True)
             return Z, Js
         else:
             raise ValueError()
 
+    def batch(self, As, k, over, axis, rng):
+        """
+        Return [self(A, k, over, axis, rng) for A in As], where all calls
+        share one Generator. The QRCPs of the sketches share one LAPACK
+        handle and workspace query per distinct shape; see
+        id_comps.batched_qrcp_osid.
+        """
+        rng = np.random.default_rng(rng)
+        if axis == 0:
+            Ys = [A @ self.sk_op(A, k + over, rng) for A in As]
+        elif axis == 1:
+            Ys = [self.sk_op(A.T, k + over, rng).T @ A for A in As]
+        else:
+            raise ValueError()
+        res = id_comps.batched_qrcp_osid(Ys, k, axis, overwrite_y=True)
+        return res
+
 
 @misc.set_docstring("""
     Return a rank-k RowID (axis=0) or ColumnID (axis=1) of A.
@@ -135,7 +162,6 @@ class OSID1(OneSidedID):
         power iteration method to help find a more accurate solution. 
     """) + OneSidedID.BACKGROUND)
 def osid2(A, k, over, p, axis, rng):
-    rng = np.random.default_rng(rng)
     skop = osk.SkOpGA()
     rs = RS1(skop, p - 1, ulaw.orth, passes_per_stab=1)
     alg = OSID2(rs)
@@ -160,17 +186,15 @@ class OSID2(OneSidedID):
             # Row ID
             Sk = self.sk_op(A, k + over, rng)
             Y = A @ Sk
-            _, _, Is = la.qr(Y.T, mode='economic', pivoting=True)
-            Is = Is[:k]
-            X = ulaw.apply_pinv_on_right(A, operator=A[Is, :])
+            Is = id_comps.qrcp_pivots(Y.T, k, overwrite_y=True)
+            X = ulaw.apply_pinv_on_right(A, operator=A[Is, :], method='qr')
             return X, Is
         elif axis == 1:
             # Column ID
             Sk = self.sk_op(A.T, k + over, rng).T
             Y = Sk @ A
-            _, _, J = la.qr(Y, mode='economic', pivoting=True)
-            Js = J[:k]
-            Z = ulaw.apply_pinv_on_left(A, operator=A[:, Js])
+            Js = id_comps.qrcp_pivots(Y, k, overwrite_y=True)
+            Z = ulaw.apply_pinv_on_left(A, operator=A[:, Js], method='qr')
             return Z, Js
         else:
             raise ValueError()
@@ -245,7 +269,6 @@ class TwoSidedID:
         more accurate solution. 
     """) + TwoSidedID.BACKGROUND)
 def tsid1(A, k, over, p, rng):
-    rng = np.random.default_rng(rng)
     skop = osk.SkOpGA()
     rs = RS1(skop, p - 1, ulaw.orth, passes_per_stab=1)
     osid = OSID1(rs)
@@ -269,12 +292,13 @@ class TSID1(TwoSidedID):
     @misc.set_docstring(TwoSidedID.CALL_DOC % '')
     def __call__(self, A, k, over, rng):
         rng = np.random.default_rng(rng)
+        # A[:, Js] and A[Is, :] are gathered copies, so QRCP can overwrite them.
         if A.shape[0] > A.shape[1]:
             X, Js = self.osid(A, k, over, axis=1, rng=rng)
-            Z, Is = id_comps.qrcp_osid(A[:, Js], k, axis=0)
+            Z, Is = id_comps.qrcp_osid(A[:, Js], k, axis=0, overwrite_y=True)
         else:
             Z, Is = self.osid(A, k, over, axis=0, rng=rng)
-            X, Js = id_comps.qrcp_osid(A[Is, :], k, axis=1)
+            X, Js = id_comps.qrcp_osid(A[Is, :], k, axis=1, overwrite_y=True)
         return Z, Is, X, Js
 
 
@@ -346,7 +370,6 @@ class CURDecomposition:
         more accurate solution. 
     """) + CURDecomposition.BACKGROUND)
 def cur1(A, k, over, p, rng):
-    rng = np.random.default_rng(rng)
     skop = osk.SkOpGA()
     rs = RS1(skop, p - 2, ulaw.orth, passes_per_stab=1)
     osid = OSID1(rs)
@@ -372,16 +395,14 @@ class CUR1(CURDecomposition):
         if A.shape[0] > A.shape[1]:
             X, Js = self.osid(A, k, over, axis=1, rng=rng)
             # A \approx A[:, Js] @ X
-            _, _, Is = la.qr(A[:, Js].T, mode='economic', pivoting=True)
-            Is = Is[:k]
-            U = ulaw.apply_pinv_on_right(X, operator=A[Is, :])
+            Is = id_comps.qrcp_pivots(A[:, Js].T, k, overwrite_y=True)
+            U = ulaw.apply_pinv_on_right(X, operator=A[Is, :], method='qr')
             # U = X (A[Is, :]^\dagger)
             return Js, U, Is
         else:
             Z, Is = self.osid(A, k, over, axis=0, rng=rng)
             # A \approx Z @ A[Is, :]
-            _, _, Js = la.qr(A[Is, :], mode='economic', pivoting=True)
-            Js = Js[:k]
-            U = ulaw.apply_pinv_on_left(Z, operator=A[:, Js])
+            Js = id_comps.qrcp_pivots(A[Is, :], k, overwrite_y=True)
+            U = ulaw.apply_pinv_on_left(Z, operator=A[:, Js], method='qr')
             # U = A[:, Js]^\dagger Z
             return Js, U, Is
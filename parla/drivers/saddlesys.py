@@ -89,6 +89,8 @@ def sps(A, b, c, delta, tol, iter_lim, rng, sampling_factor=3, vec_nnz=8, method
 class SPS1(SaddleSolver):
     """
     SVD-based sketch-and-precondition for solving saddle point systems.
+    An instance keeps workspace between calls (through its iterative solver),
+    so it must not run two solves at the same time.
     """
 
     INTERFACE_FIELDS = (
@@ -115,9 +117,23 @@ class SPS1(SaddleSolver):
 
     def __init__(self, sketch_op_gen,
                  sampling_factor: int,
-                 iterative_solver: Union[NoneType, dsad.PrecondSaddleSolver]):
+                 iterative_solver: Union[NoneType, dsad.PrecondSaddleSolver],
+                 check_presolve=True,
+                 precond_dtype=np.float64,
+                 fast_precond=False):
         self.sketch_op_gen = sketch_op_gen
         self.sampling_factor = sampling_factor
+        # If True, only initialize the iterative solver at the sketch-and-solve
+        # solution if that beats the origin. The check costs one pass each
+        # over A and A'. If False, always start from the sketch-and-solve
+        # solution.
+        self.check_presolve = check_presolve
+        # Precision for the SVD of the sketch (when sampling_factor >= 1).
+        # The iterative phase always runs in double precision.
+        self.precond_dtype = precond_dtype
+        # If True (and sampling_factor >= 1), try to precondition with a
+        # Cholesky factor of A_ske' A_ske before falling back on an SVD of A_ske.
+        self.fast_precond = fast_precond
         if iterative_solver is None:
             iterative_solver = dsad.PcSS1()
         self.iterative_solver = iterative_solver
@@ -138,19 +154,39 @@ class SPS1(SaddleSolver):
         quick_time = time.time if logging else lambda: 0
         log = SketchAndPrecondLog()
 
+        if c is None:
+            rhs = ulaw.gemv(1.0, A, b, trans=True)
+        else:
+            rhs = ulaw.gemv(1.0, A, b, beta=-1.0, y=c.copy(), trans=True)
+
+        if isinstance(self.iterative_solver, dsad.PcSS1):
+            # PcSS1 solves some problems by Cholesky without using the
+            # preconditioner, so check for that before sketching.
+            tic = quick_time()
+            res = self.iterative_solver.direct_solve(A, b, delta, rhs)
+            if res is not None:
+                log.time_iterate = quick_time() - tic
+                if logging:
+                    log.wrap_up(res[2], la.norm(rhs))
+                    log.error_desc = self.iterative_solver.ERROR_METRIC_INFO
+                return res[0], res[1], log
+
         nystrom_like = d < n
 
         if not nystrom_like:
             # Sketch the data matrix
             tic = quick_time()
             S = self.sketch_op_gen(d, m, rng)
-            A_ske = S @ A
-            A_ske = rpc.a_lift(A_ske, sqrt_delta)  # returns A_ske when delta=0.
+            A_ske = rpc.sketch_and_lift(S, A, sqrt_delta)  # S @ A when delta=0.
             log.time_sketch = quick_time() - tic
 
             # Factor the sketch
             tic = quick_time()
-            M, U, sigma, Vh = rpc.svd_right_precond(A_ske)
+            M, Vh = None, None
+            if self.fast_precond:
+                M = rpc.chol_right_precond(A_ske)
+            if M is None:
+                M, U, sigma, Vh = rpc.svd_right_precond(A_ske, self.precond_dtype)
             log.time_factor = quick_time() - tic
         else:
             if self.nystrom_strategy == 'right':
@@ -182,9 +218,6 @@ class SPS1(SaddleSolver):
             # end if: preconditioner generation via Nystrom
         # end if: preconditioner generation
 
-        rhs = A.T @ b
-        if c is not None:
-            rhs -= c
         # Presolve ...
         #   (A_ske' A_ske ) x_ske = (A'b - c)                         (1, define)
         #   (V \Sigma^2 V') x_ske = (A'b - c)                         (2)
@@ -193,12 +226,18 @@ class SPS1(SaddleSolver):
         #   z_ske = \Sigma^{\dagger} V'(A'b - c)                      (5)
         tic = quick_time()
         if not nystrom_like:
-            z_ske = (Vh @ rhs) / sigma
-            x_ske = M @ z_ske
-            rhs_pc = M.T @ rhs
-            lhs_ske_pc = M.T @ (A.T @ (A @ x_ske) + delta*x_ske)
-            if la.norm(lhs_ske_pc - rhs_pc, ord=2) >= la.norm(rhs_pc, ord=2):
-                z_ske = None
+            if Vh is None:
+                z_ske = M.T @ rhs  # M = R^{-1} for A_ske' A_ske = R' R.
+            else:
+                z_ske = (Vh @ rhs) / sigma
+            if self.check_presolve:
+                x_ske = M @ z_ske
+                rhs_pc = z_ske  # equal to M.T @ rhs.
+                lhs_ske = ulaw.gemv(1.0, A, ulaw.gemv(1.0, A, x_ske),
+                                    beta=delta, y=x_ske.copy(), trans=True)
+                lhs_ske_pc = M.T @ lhs_ske
+                if la.norm(lhs_ske_pc - rhs_pc, ord=2) >= la.norm(rhs_pc, ord=2):
+                    z_ske = None
         else:
             #TODO: properly initialize when using a low-rank sketch
             z_ske = None
@@ -206,7 +245,12 @@ class SPS1(SaddleSolver):
 
         # Main iterative phase
         tic = quick_time()
-        res = self.iterative_solver(A, b, c, delta, tol, iter_lim, M, False, z_ske)
+        if isinstance(self.iterative_solver, dsad.PcSS1):
+            # direct_solve returned None above; don't let PcSS1 repeat it.
+            res = self.iterative_solver._pcg_solve(A, b, rhs, delta, tol,
+                                                   iter_lim, M, z_ske)
+        else:
+            res = self.iterative_solver(A, b, c, delta, tol, iter_lim, M, False, z_ske)
         log.time_iterate = quick_time() - tic
         x_star = res[0]
         y_star = res[1]
@@ -221,7 +265,9 @@ class SPS1(SaddleSolver):
 
 class SPS2(SaddleSolver):
     """Sketch, reduced to overdetermined least squares, and precondition.
-    Use SVD to obtain the preconditioner and LSQR as the iterative solver."""
+    Use SVD to obtain the preconditioner and LSQR as the iterative solver.
+    An instance keeps workspace between calls, so it must not run two solves
+    at the same time."""
 
     INTERFACE_FIELDS = (
         """
@@ -259,6 +305,7 @@ class SPS2(SaddleSolver):
         if iterative_solver is None:
             iterative_solver = dsad.PcSS2()
         self.iterative_solver = iterative_solver
+        self._buffers = dict()  # workspace; see misc.get_workspace.
         pass
 
     @misc.set_docstring(DOC_STR)
@@ -277,8 +324,7 @@ class SPS2(SaddleSolver):
         # Sketch the data matrix
         tic = quick_time()
         S = self.sketch_op_gen(d, m, rng)
-        A_ske = S @ A
-        A_ske = rpc.a_lift(A_ske, sqrt_delta)  # returns A_ske when delta=0.
+        A_ske = rpc.sketch_and_lift(S, A, sqrt_delta)  # S @ A when delta=0.
         log.time_sketch = quick_time() - tic
 
         # Factor the sketch
@@ -289,7 +335,10 @@ class SPS2(SaddleSolver):
         # Convert to overdetermined least squares (if applicable).
         tic = quick_time()
         A_aug = rpc.a_lift(A, sqrt_delta)  # returns A when delta=0.
-        b_aug = np.concatenate((b, np.zeros(n))) if delta > 0 else b.copy()
+        b_aug = misc.get_workspace(self._buffers, 'b_aug',
+                                   (m + n if delta > 0 else m,))
+        b_aug[:m] = b
+        b_aug[m:] = 0.0
         if c is not None and la.norm(c) > 0:
             v = U @ ((1/sigma) * (Vh @ c))
             b_aug[:m] -= S.T @ v[:d]
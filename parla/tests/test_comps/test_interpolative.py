@@ -0,0 +1,55 @@
+import unittest
+import numpy as np
+import scipy.linalg as la
+import parla.comps.interpolative as id_comps
+
+
+def reference_qrcp_osid(Y, k, axis):
+    if axis == 0:
+        X, Is = reference_qrcp_osid(Y.T, k, axis=1)
+        return X.T, Is
+    S, J = la.qr(Y, mode='r', pivoting=True)
+    S_trailing = la.solve_triangular(S[:k, :k], S[:k, k:], lower=False)
+    X = np.zeros((k, Y.shape[1]))
+    X[:, J] = np.hstack((np.eye(k), S_trailing))
+    return X, J[:k]
+
+
+class TestQRCPPivots(unittest.TestCase):
+
+    def test_batched_mixed_shapes(self):
+        rng = np.random.default_rng(0)
+        shapes = [(40, 30), (20, 50), (40, 30), (30, 30), (20, 50)]
+        Ys = [rng.standard_normal(shape) for shape in shapes]
+        # Row-major inputs are handled as well as column-major ones.
+        Ys[1] = np.ascontiguousarray(Ys[1])
+        Ys[3] = np.asfortranarray(Ys[3])
+        k = 15
+        idxs = id_comps.batched_qrcp_pivots([Y.copy() for Y in Ys], k)
+        self.assertEqual(len(idxs), len(Ys))
+        for Y, J in zip(Ys, idxs):
+            _, J_ref = la.qr(Y, mode='r', pivoting=True)
+            self.assertTrue(np.array_equal(J, J_ref[:k]))
+            self.assertTrue(np.array_equal(J, id_comps.qrcp_pivots(Y, k)))
+
+    def test_batched_empty(self):
+        self.assertEqual(id_comps.batched_qrcp_pivots([], 3), [])
+
+
+class TestQRCPOSID(unittest.TestCase):
+
+    def test_batched_mixed_shapes(self):
+        rng = np.random.default_rng(0)
+        shapes = [(40, 30), (20, 50), (40, 30), (30, 30)]
+        Ys = [rng.standard_normal(shape) for shape in shapes]
+        k = 15
+        for axis in [0, 1]:
+            res = id_comps.batched_qrcp_osid([Y.copy() for Y in Ys], k, axis)
+            self.assertEqual(len(res), len(Ys))
+            for Y, (M, P) in zip(Ys, res):
+                M_ref, P_ref = reference_qrcp_osid(Y, k, axis)
+                self.assertTrue(np.array_equal(P, P_ref))
+                self.assertLess(la.norm(M - M_ref), 1e-10 * la.norm(M_ref))
+                M_one, P_one = id_comps.qrcp_osid(Y, k, axis)
+                self.assertTrue(np.array_equal(P, P_one))
+                self.assertTrue(np.array_equal(M, M_one))
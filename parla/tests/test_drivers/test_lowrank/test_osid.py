@@ -1,7 +1,7 @@
 import unittest
 import numpy as np
 import scipy.linalg as la
-from parla.drivers.interpolative import OSID1, OSID2
+from parla.drivers.interpolative import OSID1, OSID2, osid1, batched_osid1
 from parla.comps.sketchers.aware import RS1
 from parla.comps.interpolative import qrcp_osid
 import parla.comps.sketchers.oblivious as oblivious
@@ -67,6 +67,22 @@ class TestOSIDs(unittest.TestCase):
             run_osid_test(alg, m, n, rank=28, k=28, over=1, axis=1, test_tol=1e-12, seed=2)
             run_osid_test(alg, m, n, rank=3, k=3, over=2, axis=1, test_tol=1e-12, seed=2)
 
+    def test_batched_osid1(self):
+        m, n, k, over = 100, 30, 27, 3
+        rng = np.random.default_rng(0)
+        As = [matmakers.rand_low_rank(m, n, k, rng) for _ in range(3)]
+        As.append(As[0][:80, :])
+        for axis in [0, 1]:
+            res = batched_osid1(As, k, over, 3, axis, rng=1)
+            rng_ref = np.random.default_rng(1)
+            for A, (M, P) in zip(As, res):
+                M_ref, P_ref = osid1(A, k, over, 3, axis, rng_ref)
+                self.assertTrue(np.array_equal(P, P_ref))
+                self.assertLess(la.norm(M - M_ref), 1e-10)
+                A_id = M @ A[P, :] if axis == 0 else A[:, P] @ M
+                rel_err = la.norm(A - A_id) / la.norm(A)
+                self.assertLess(rel_err, 1e-10)
+
     def test_simple_approx(self):
         gaussian_operator = oblivious.SkOpGA()
         rso = RS1(
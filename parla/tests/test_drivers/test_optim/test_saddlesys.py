@@ -243,6 +243,85 @@ class TestSPS1(TestSaddleSolver):
         alg = TestSPS1.default_config()
         self._test_tiny_scale(alg)
 
+    def test_single_precision_precond(self):
+        alg = TestSPS1.default_config()
+        alg.precond_dtype = np.float32
+        rng = np.random.default_rng(0)
+        test_tol = 1e-6
+        alg_tol = self.get_alg_tol(alg, test_tol)
+        # A float32 SVD can't resolve singular values much below 1e-7 * sigma_max,
+        # so keep the condition number of A moderate.
+        m, n, cond_num = 1000, 100, 1e3
+        spectrum = np.linspace(cond_num ** 0.5, cond_num ** -0.5, num=n)
+        for delta in [0.0, 0.5]:
+            ath = make_simple_prob(m, n, spectrum, delta, rng)
+            self.run_ath(ath, alg, alg_tol, 50, test_tol, self.SEEDS)
+        # Rank-deficient A. The float32 noise in the sketch's trailing singular
+        # values must not be inverted into the preconditioner.
+        rank = 60
+        spectrum = np.linspace(cond_num ** 0.5, cond_num ** -0.5, num=rank)
+        ath = make_simple_prob(m, n, spectrum, 0.0, rng)
+        for seed in self.SEEDS:
+            x, _, log = alg(ath.A, ath.b, None, 0.0, 1e-12, 50, seed)
+            gap = ath.A.T @ (ath.b - ath.A @ x)
+            self.assertLessEqual(la.norm(gap) / np.max(spectrum), 1e-9)
+
+    def test_cholesky_precond(self):
+        alg = TestSPS1.default_config()
+        alg.fast_precond = True
+        self._test_linspace_spec(alg)
+        self._test_logspace_spec(alg)
+
+    def test_unchecked_presolve(self):
+        alg = SPS1(
+            sketch_op_gen=oblivious.SkOpSJ(),
+            sampling_factor=3,
+            iterative_solver=dsad.PcSS1(),
+            check_presolve=False
+        )
+        self._test_linspace_spec(alg)
+
+    def test_direct_gram_solve(self):
+        # Very tall, thin, and regularized: PcSS1 solves by Cholesky on A'A.
+        alg = TestSPS1.default_config()
+        rng = np.random.default_rng(0)
+        m, n, cond_num = 2000, 50, 1e3
+        spectrum = np.linspace(cond_num ** 0.5, cond_num ** -0.5, num=n)
+        ath = make_simple_prob(m, n, spectrum, 0.5, rng)
+        self.run_ath(ath, alg, 1e-12, n, 1e-9, self.SEEDS, rates=False)
+        self.assertEqual(ath.result[2].errors.size, 2)
+
+    def test_tall_regularized_pcg(self):
+        # Same shape as test_direct_gram_solve, but with the direct path off.
+        alg = TestSPS1.default_config()
+        alg.iterative_solver.DIRECT_MAX_N = 0
+        rng = np.random.default_rng(0)
+        m, n, cond_num = 2000, 50, 1e3
+        spectrum = np.linspace(cond_num ** 0.5, cond_num ** -0.5, num=n)
+        ath = make_simple_prob(m, n, spectrum, 0.5, rng)
+        self.run_ath(ath, alg, 1e-12, n, 1e-9, self.SEEDS, rates=False)
+        self.assertGreater(ath.result[2].errors.size, 2)
+
+
+class TestPcSS2(unittest.TestCase):
+
+    def test_reuse_across_shapes(self):
+        # The two problems have the same m + n, so PcSS2 reuses its
+        # buffer for [b; zeros(n)] between them.
+        alg = dsad.PcSS2()
+        rng = np.random.default_rng(0)
+        delta = 0.5
+        for m, n in [(105, 5), (100, 10)]:
+            A = rng.standard_normal((m, n))
+            b = rng.standard_normal(m)
+            A_lift = np.row_stack((A, np.sqrt(delta) * np.eye(n)))
+            _, sigma, Vh = la.svd(A_lift, full_matrices=False)
+            M = Vh.T / sigma
+            x, y, _ = alg(A, b, None, delta, 1e-12, 100, M, False, None)
+            x_opt = la.solve(A.T @ A + delta * np.eye(n), A.T @ b)
+            self.assertLessEqual(la.norm(x - x_opt) / la.norm(x_opt), 1e-10)
+            self.assertLessEqual(la.norm(y - (b - A @ x_opt)), 1e-10)
+
 
 class TestSPS1_Nystrom(TestSaddleSolver):
 
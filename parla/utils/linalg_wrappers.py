@@ -24,13 +24,74 @@ def lup(M):
     return U.T, L.T, P.T
 
 
-def apply_pinv_on_left(target, operator):
-    """return res = pinv(operator) @ target"""
+def apply_pinv_on_left(target, operator, method='lstsq'):
+    """
+    return res = pinv(operator) @ target
+
+    If method='qr', then operator is assumed to have full column rank and
+    res is computed by a QR decomposition and a triangular solve. This falls
+    back on method='lstsq' if operator is numerically rank-deficient.
+    """
+    if method == 'qr':
+        res = _qr_solve(operator, target)
+        if res is not None:
+            return res
+    elif method != 'lstsq':
+        raise ValueError()
     res = la.lstsq(operator, target)[0]
     return res
 
 
-def apply_pinv_on_right(target, operator):
-    """return res = target @ pinv(operator)"""
+def apply_pinv_on_right(target, operator, method='lstsq'):
+    """
+    return res = target @ pinv(operator)
+
+    If method='qr', then operator is assumed to have full row rank and
+    res is computed by a QR decomposition and a triangular solve. This falls
+    back on method='lstsq' if operator is numerically rank-deficient.
+    """
+    if method == 'qr':
+        res = _qr_solve(operator.T, target.T)
+        if res is not None:
+            return res.T
+    elif method != 'lstsq':
+        raise ValueError()
     res = la.lstsq(operator.T, target.T)[0].T
     return res
+
+
+def _qr_solve(B, T):
+    """return pinv(B) @ T for tall B, or None if B is numerically rank-deficient"""
+    Q, R = la.qr(B, mode='economic', check_finite=False)
+    diag = np.abs(np.diag(R))
+    if diag.min() <= diag.max() * max(B.shape) * np.finfo(R.dtype).eps:
+        return None
+    res = la.solve_triangular(R, Q.T @ T, lower=False, overwrite_b=True,
+                              check_finite=False)
+    return res
+
+
+def gemv(alpha, A, x, beta=0.0, y=None, trans=False):
+    """
+    Return alpha * op(A) @ x + beta * y, where op(A) = A.T if trans else A.
+
+    This calls BLAS directly. If y is a contiguous array of the same dtype
+    as A, then y is overwritten with the result (and returned). A can be in
+    either row-major or column-major order; row-major A is handled by calling
+    BLAS on A.T with the opposite transpose flag, so A is never copied.
+
+    If A is not an ndarray (e.g., a SciPy sparse matrix or LinearOperator),
+    then the result is computed with A's own matvec and returned as a new array.
+    """
+    if y is None:
+        beta = 0.0
+    if not isinstance(A, np.ndarray):
+        res = alpha * (A.T @ x if trans else A @ x)
+        if beta != 0.0:
+            res += beta * y
+        return res
+    if not A.flags['F_CONTIGUOUS'] and A.flags['C_CONTIGUOUS']:
+        A = A.T
+        trans = not trans
+    fn = la.get_blas_funcs('gemv', (A, x))
+    return fn(alpha, A, x, beta=beta, y=y, trans=int(trans), overwrite_y=1)
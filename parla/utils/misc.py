@@ -1,3 +1,4 @@
+import numpy as np
 
 
 def set_docstring(docstr):
@@ -5,3 +6,17 @@ def set_docstring(docstr):
         fn.__doc__ = docstr
         return fn
     return assign
+
+
+def get_workspace(buffers: dict, name, shape):
+    """
+    Return buffers[name] if it has the given shape. Otherwise, allocate a new
+    array of that shape, store it as buffers[name], and return it. The contents
+    of the returned array are undefined, so callers must write every entry they
+    later read.
+    """
+    buf = buffers.get(name)
+    if buf is None or buf.shape != shape:
+        buf = np.empty(shape)
+        buffers[name] = buf
+    return buf